@@ -3,16 +3,27 @@ package main
 import (
 	"math"
 	"regexp"
+	"runtime"
 	"sort"
 	"strings"
+	"sync"
 )
 
+// parallelScoreThreshold is the caption count from which frames are scored
+// concurrently; below it goroutine startup costs more than the scoring itself
+const parallelScoreThreshold = 64
+
 // FrameSelector implements intelligent frame selection for trading strategy extraction
 type FrameSelector struct {
 	TranscriptKeywords map[float64][]string  // timestamp -> keywords
 	OCRConfidence     map[string]float64     // frame -> confidence
 	SceneChanges      map[string]float64     // frame -> delta
 	IndicatorAliases  map[string][]string    // normalized -> aliases
+
+	// Keyword timestamps sorted ascending with their normalized keyword scores
+	// in a parallel slice, for windowed lookups over flat arrays
+	keywordTimes  []float64
+	keywordScores []float64
 }
 
 // NewFrameSelector creates a new frame selector with trading indicator aliases
@@ -55,8 +66,7 @@ func (fs *FrameSelector) SelectKeyFrames(captions []FrameCaption, transcript Tra
 
 	// Step 2: Score all frames
 	var scoredFrames []FrameScore
-	for _, caption := range captions {
-		score := fs.scoreFrame(caption, transcript.Duration)
+	for _, score := range fs.scoreFrames(captions, transcript.Duration) {
 		if score.Score > 0 {
 			scoredFrames = append(scoredFrames, score)
 		}
@@ -103,6 +113,8 @@ func (fs *FrameSelector) extractTranscriptKeywords(transcript TranscriptOutput)
 		"stop", "target", "risk", "reward", "size",
 	}
 
+	pricePattern := regexp.MustCompile(`\$?(\d+\.?\d*)\s*(dollars?|cents?|k|thousand|mil|million)?`)
+
 	for _, segment := range transcript.Segments {
 		var keywords []string
 		text := strings.ToLower(segment.Text)
@@ -114,7 +126,6 @@ func (fs *FrameSelector) extractTranscriptKeywords(transcript TranscriptOutput)
 		}
 		
 		// Also extract price mentions
-		pricePattern := regexp.MustCompile(`\$?(\d+\.?\d*)\s*(dollars?|cents?|k|thousand|mil|million)?`)
 		matches := pricePattern.FindAllString(text, -1)
 		for _, match := range matches {
 			keywords = append(keywords, "price:"+match)
@@ -124,16 +135,62 @@ func (fs *FrameSelector) extractTranscriptKeywords(transcript TranscriptOutput)
 			fs.TranscriptKeywords[segment.Start] = keywords
 		}
 	}
+
+	// Index keyword timestamps so frames only visit entries inside their window
+	fs.keywordTimes = make([]float64, 0, len(fs.TranscriptKeywords))
+	for transcriptTime := range fs.TranscriptKeywords {
+		fs.keywordTimes = append(fs.keywordTimes, transcriptTime)
+	}
+	sort.Float64s(fs.keywordTimes)
+
+	fs.keywordScores = make([]float64, len(fs.keywordTimes))
+	for i, transcriptTime := range fs.keywordTimes {
+		fs.keywordScores[i] = float64(len(fs.TranscriptKeywords[transcriptTime])) / 10.0 // Normalize by keyword count
+	}
+}
+
+// scoreFrames scores every caption in order, spreading the work across CPUs for
+// long videos. scoreFrame only reads selector state, so frames score independently.
+func (fs *FrameSelector) scoreFrames(captions []FrameCaption, videoDuration float64) []FrameScore {
+	scores := make([]FrameScore, len(captions))
+	relevance := fs.transcriptRelevanceScores(captions)
+	workers := runtime.NumCPU()
+
+	if len(captions) < parallelScoreThreshold || workers < 2 {
+		for i, caption := range captions {
+			scores[i] = fs.scoreFrame(caption, relevance[i], videoDuration)
+		}
+		return scores
+	}
+
+	chunkSize := (len(captions) + workers - 1) / workers
+	var wg sync.WaitGroup
+	for start := 0; start < len(captions); start += chunkSize {
+		end := start + chunkSize
+		if end > len(captions) {
+			end = len(captions)
+		}
+
+		wg.Add(1)
+		go func(start, end int) {
+			defer wg.Done()
+			for i := start; i < end; i++ {
+				scores[i] = fs.scoreFrame(captions[i], relevance[i], videoDuration)
+			}
+		}(start, end)
+	}
+	wg.Wait()
+
+	return scores
 }
 
 // scoreFrame calculates a composite score for a frame based on multiple criteria
-func (fs *FrameSelector) scoreFrame(caption FrameCaption, videoDuration float64) FrameScore {
+func (fs *FrameSelector) scoreFrame(caption FrameCaption, transcriptScore float64, videoDuration float64) FrameScore {
 	var score float64
 	var reasons []string
 	priority := 3 // Default to lowest priority
 
 	// Priority 1: Frames mentioned in transcript by timestamp (±3s window)
-	transcriptScore := fs.getTranscriptRelevanceScore(caption.Timestamp)
 	if transcriptScore > 0 {
 		priority = 1
 		score += transcriptScore * 100 // High weight for transcript relevance
@@ -182,21 +239,48 @@ func (fs *FrameSelector) scoreFrame(caption FrameCaption, videoDuration float64)
 	}
 }
 
-// getTranscriptRelevanceScore returns score based on proximity to transcript keywords
-func (fs *FrameSelector) getTranscriptRelevanceScore(timestamp float64) float64 {
-	maxScore := 0.0
-	
-	for transcriptTime, keywords := range fs.TranscriptKeywords {
-		// ±3 second window as specified in PRP
-		if math.Abs(timestamp-transcriptTime) <= 3.0 {
-			keywordScore := float64(len(keywords)) / 10.0 // Normalize by keyword count
-			if keywordScore > maxScore {
-				maxScore = keywordScore
+// transcriptRelevanceScores returns, for each caption, the strongest transcript
+// keyword score within ±3 seconds of its timestamp (the window from the PRP).
+// Captions are visited in time order so both window edges only move forward:
+// keyword entries are pushed as the window reaches them and popped once it has
+// passed, and a deque of indices with decreasing scores keeps the maximum at its front.
+func (fs *FrameSelector) transcriptRelevanceScores(captions []FrameCaption) []float64 {
+	relevance := make([]float64, len(captions))
+	times := fs.keywordTimes
+	if len(times) == 0 {
+		return relevance
+	}
+
+	order := make([]int, len(captions))
+	for i := range order {
+		order[i] = i
+	}
+	sort.SliceStable(order, func(a, b int) bool {
+		return captions[order[a]].Timestamp < captions[order[b]].Timestamp
+	})
+
+	window := make([]int, 0, len(times))
+	next := 0
+	for _, ci := range order {
+		timestamp := captions[ci].Timestamp
+
+		for next < len(times) && times[next]-timestamp <= 3.0 {
+			for len(window) > 0 && fs.keywordScores[window[len(window)-1]] <= fs.keywordScores[next] {
+				window = window[:len(window)-1]
 			}
+			window = append(window, next)
+			next++
+		}
+		for len(window) > 0 && timestamp-times[window[0]] > 3.0 {
+			window = window[1:]
+		}
+
+		if len(window) > 0 && fs.keywordScores[window[0]] > 0 {
+			relevance[ci] = math.Min(fs.keywordScores[window[0]], 1.0)
 		}
 	}
-	
-	return math.Min(maxScore, 1.0)
+
+	return relevance
 }
 
 // getOCRIndicatorScore analyzes OCR text for trading indicators
@@ -8,11 +8,14 @@ import (
 	"net/http"
 	"os"
 	"os/exec"
+	"os/signal"
 	"path/filepath"
 	"regexp"
 	"runtime"
 	"strconv"
 	"strings"
+	"sync"
+	"syscall"
 	"time"
 
 	"github.com/spf13/cobra"
@@ -170,6 +173,9 @@ func init() {
 var (
 	whisperModel      string
 	whisperBackend    string
+	whisperBeamSize   int
+	whisperBatchSize  int
+	whisperMLX4bit    bool
 	frameInterval     int
 	frameFormat       string
 	maxFrames         int
@@ -178,6 +184,7 @@ var (
 	skipTranscript    bool
 	skipFrames        bool
 	youtubeTranscript bool
+	stageLocal        bool
 	// Caption generation options
 	generateCaptions     bool
 	captionsModelFlag    string
@@ -217,8 +224,11 @@ Trading strategy extraction with captions:
 
 func init() {
 	// Whisper options
-	analyzeCmd.Flags().StringVar(&whisperModel, "whisper-model", "base", "Whisper model size (tiny, base, small, medium, large)")
-	analyzeCmd.Flags().StringVar(&whisperBackend, "whisper-backend", "auto", "Whisper backend (auto, mlx, faster-whisper, openai-whisper)")
+	analyzeCmd.Flags().StringVar(&whisperModel, "whisper-model", "base", "Whisper model size (tiny, base, small, medium, large, distil-large-v3)")
+	analyzeCmd.Flags().StringVar(&whisperBackend, "whisper-backend", "auto", "Whisper backend (auto, mlx, whisper-cpp, faster-whisper, openai-whisper)")
+	analyzeCmd.Flags().IntVar(&whisperBeamSize, "whisper-beam-size", 1, "Beam size for faster-whisper decoding (1 = greedy, fastest)")
+	analyzeCmd.Flags().IntVar(&whisperBatchSize, "whisper-batch-size", 0, "Batch size for batched faster-whisper inference (0 = auto: 16 on CUDA, 4 on CPU)")
+	analyzeCmd.Flags().BoolVar(&whisperMLX4bit, "whisper-mlx-4bit", false, "Use 4-bit quantized MLX Whisper models when available (faster, Apple Silicon)")
 	
 	// Frame extraction options
 	analyzeCmd.Flags().IntVar(&frameInterval, "frame-interval", 30, "Frame extraction interval in seconds")
@@ -231,6 +241,8 @@ func init() {
 	analyzeCmd.Flags().BoolVar(&skipTranscript, "skip-transcript", false, "Skip transcript extraction (frames only)")
 	analyzeCmd.Flags().BoolVar(&skipFrames, "skip-frames", false, "Skip frame extraction (transcript only)")
 	analyzeCmd.Flags().BoolVar(&youtubeTranscript, "youtube-transcript", false, "Use YouTube's native transcript instead of Whisper (YouTube URLs only)")
+	analyzeCmd.Flags().BoolVar(&noTranscriptCache, "no-cache", false, "Always re-transcribe instead of reusing a cached transcript")
+	analyzeCmd.Flags().BoolVar(&stageLocal, "stage-local", false, "Copy the input to local temp storage first (for files on NAS/network mounts)")
 	
 	// Caption generation options
 	analyzeCmd.Flags().BoolVar(&generateCaptions, "generate-captions", false, "Generate visual captions using Ollama (requires Ollama)")
@@ -246,10 +258,14 @@ var (
 	transcribeModel    string
 	transcribeLanguage string
 	transcribeBackend  string
+	transcribeBeamSize int
+	transcribeBatchSize int
+	transcribeMLX4bit  bool
+	transcribeJobs     int
 )
 
 var transcribeCmd = &cobra.Command{
-	Use:   "transcribe [video_file]",
+	Use:   "transcribe [video_file...]",
 	Short: "Extract transcript from video using Whisper",
 	Long: `Transcribes video/audio files using Whisper AI models with support for
 multiple backends including MLX for Apple Silicon GPU acceleration.
@@ -260,15 +276,27 @@ that can be piped to Fabric patterns for video analysis.
 Examples:
   scribe transcribe video.mp4 | fabric -p analyze_video_content
   scribe transcribe --model large lecture.mp4 | fabric -p summarize_lecture
-  scribe transcribe --backend mlx tutorial.mp4 | fabric -p extract_code_from_video`,
-	Args: cobra.ExactArgs(1),
+  scribe transcribe --backend mlx tutorial.mp4 | fabric -p extract_code_from_video
+  scribe transcribe --jobs 2 lectures/*.mp4 > transcripts.json
+
+A single file prints one JSON transcript object; two or more files print a JSON
+array of transcripts in argument order. A glob that matches only one file
+therefore yields an object, not a one-element array.
+Parallel jobs apply to CPU backends only; GPU backends (MLX, CUDA, MPS)
+transcribe one file at a time.`,
+	Args: cobra.MinimumNArgs(1),
 	RunE: runTranscribe,
 }
 
 func init() {
-	transcribeCmd.Flags().StringVar(&transcribeModel, "model", "base", "Whisper model size (tiny, base, small, medium, large, large-v2, large-v3)")
+	transcribeCmd.Flags().StringVar(&transcribeModel, "model", "base", "Whisper model size (tiny, base, small, medium, large, large-v2, large-v3, distil-large-v3)")
 	transcribeCmd.Flags().StringVar(&transcribeLanguage, "language", "", "Force specific language (optional)")
-	transcribeCmd.Flags().StringVar(&transcribeBackend, "backend", "auto", "Transcription backend (auto, mlx, faster-whisper, openai-whisper)")
+	transcribeCmd.Flags().StringVar(&transcribeBackend, "backend", "auto", "Transcription backend (auto, mlx, whisper-cpp, faster-whisper, openai-whisper)")
+	transcribeCmd.Flags().IntVar(&transcribeBeamSize, "beam-size", 1, "Beam size for faster-whisper decoding (1 = greedy, fastest)")
+	transcribeCmd.Flags().IntVar(&transcribeBatchSize, "batch-size", 0, "Batch size for batched faster-whisper inference (0 = auto: 16 on CUDA, 4 on CPU)")
+	transcribeCmd.Flags().BoolVar(&transcribeMLX4bit, "mlx-4bit", false, "Use 4-bit quantized MLX Whisper models when available (faster, Apple Silicon)")
+	transcribeCmd.Flags().BoolVar(&noTranscriptCache, "no-cache", false, "Always re-transcribe instead of reusing a cached transcript")
+	transcribeCmd.Flags().IntVar(&transcribeJobs, "jobs", 1, "Number of files to transcribe concurrently on CPU backends (each job loads its own model and gets a share of the cores)")
 }
 
 // Frames subcommand (replaces video_frames)
@@ -386,8 +414,23 @@ Example:
 // Implementation functions
 func runAnalyze(cmd *cobra.Command, args []string) error {
 	input := args[0]
+
+	// Cannot skip both transcript and frames; check before any download or staging
+	if skipTranscript && skipFrames {
+		return fmt.Errorf("cannot skip both transcript and frames")
+	}
+
+	// Downloads and frame extraction run in their own process groups (see
+	// commandContext), so Ctrl-C reaches them through this context
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	defer stop()
+
 	var videoFile string
 	var isYoutube bool = isYouTubeURL(input)
+	// Set when the video is only needed for frames and is downloaded alongside the caption fetch
+	var downloadForFrames bool
+	// Original path of an input that was copied locally with --stage-local
+	var stagedFrom string
 
 	// Handle YouTube URLs
 	if isYoutube {
@@ -395,24 +438,17 @@ func runAnalyze(cmd *cobra.Command, args []string) error {
 			fmt.Fprintf(os.Stderr, "Detected YouTube URL: %s\n", input)
 		}
 		
-		// For YouTube transcript mode, we still need the video file for frames
+		// For YouTube transcript mode, we still need the video file for frames; it
+		// is downloaded by the frame stage so it overlaps the caption fetch
 		if youtubeTranscript && !skipFrames {
-			// Download video for frame extraction
-			if verbose {
-				fmt.Fprintf(os.Stderr, "Downloading video for frame extraction...\n")
-			}
-			var err error
-			videoFile, err = handleYouTubeURL(input, false) // Download video
-			if err != nil {
-				return fmt.Errorf("YouTube video download failed: %v", err)
-			}
+			downloadForFrames = true
 		} else if !youtubeTranscript {
 			// Download video for both transcript and frames
 			if verbose {
 				fmt.Fprintf(os.Stderr, "Downloading video...\n")
 			}
 			var err error
-			videoFile, err = handleYouTubeURL(input, false) // Download video
+			videoFile, err = handleYouTubeURL(ctx, input, false, false) // Download video
 			if err != nil {
 				return fmt.Errorf("YouTube video download failed: %v", err)
 			}
@@ -425,59 +461,120 @@ func runAnalyze(cmd *cobra.Command, args []string) error {
 		if _, err := os.Stat(videoFile); os.IsNotExist(err) {
 			return fmt.Errorf("file not found: %s", videoFile)
 		}
-	}
 
-	// Cannot skip both transcript and frames
-	if skipTranscript && skipFrames {
-		return fmt.Errorf("cannot skip both transcript and frames")
+		// Both stages read the whole file concurrently; over a network mount it is
+		// cheaper to pull it across once and let them read the local copy
+		if stageLocal {
+			stagedFile, cleanup, err := stageVideoLocally(videoFile)
+			if err != nil {
+				return fmt.Errorf("failed to stage %s locally: %v", videoFile, err)
+			}
+			defer cleanup()
+			stagedFrom, videoFile = videoFile, stagedFile
+		}
 	}
 
 	var transcriptResult TranscriptOutput
 	var frameResult FrameOutput
-	var err error
+	var transcriptErr, frameErr error
+
+	// Transcription and frame extraction read the same video independently, so run
+	// them concurrently; wall-clock becomes the slower stage instead of the sum.
+	// A failed transcript cancels the frame stage (download and ffmpeg included)
+	// rather than letting it run to completion for a result that is thrown away.
+	stageCtx, cancelStages := context.WithCancel(ctx)
+	defer cancelStages()
+	var wg sync.WaitGroup
 
 	// Extract transcript if not skipped
 	if !skipTranscript {
-		if isYoutube && youtubeTranscript {
-			// Use YouTube's native transcript
-			if verbose {
-				fmt.Fprintf(os.Stderr, "Extracting YouTube transcript...\n")
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if isYoutube && youtubeTranscript {
+				// Use YouTube's native transcript
+				if verbose {
+					fmt.Fprintf(os.Stderr, "Extracting YouTube transcript...\n")
+				}
+				
+				transcriptResult, transcriptErr = runYouTubeTranscribe(input)
+				if transcriptErr != nil {
+					transcriptErr = fmt.Errorf("YouTube transcript extraction failed: %v", transcriptErr)
+					cancelStages()
+					return
+				}
+			} else {
+				// Use Whisper transcription
+				if verbose {
+					fmt.Fprintf(os.Stderr, "Extracting transcript with Whisper...\n")
+				}
+				
+				transcriptResult, transcriptErr = runCachedWhisperTranscribe(videoFile)
+				if transcriptErr != nil {
+					transcriptErr = fmt.Errorf("transcript extraction failed: %v", transcriptErr)
+					cancelStages()
+					return
+				}
 			}
 			
-			transcriptResult, err = runYouTubeTranscribe(input)
-			if err != nil {
-				return fmt.Errorf("YouTube transcript extraction failed: %v", err)
+			if verbose {
+				fmt.Fprintf(os.Stderr, "Transcript extracted: %d segments\n", len(transcriptResult.Segments))
 			}
-		} else {
-			// Use Whisper transcription
+		}()
+	}
+
+	// Extract frames if not skipped
+	if !skipFrames {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if downloadForFrames {
+				// Download video for frame extraction
+				if verbose {
+					fmt.Fprintf(os.Stderr, "Downloading video for frame extraction...\n")
+				}
+				// Captions supply the transcript, so skip the audio track
+				videoFile, frameErr = handleYouTubeURL(stageCtx, input, false, true)
+				if frameErr != nil {
+					frameErr = fmt.Errorf("YouTube video download failed: %v", frameErr)
+					return
+				}
+			}
+			
 			if verbose {
-				fmt.Fprintf(os.Stderr, "Extracting transcript with Whisper...\n")
+				fmt.Fprintf(os.Stderr, "Extracting frames...\n")
 			}
 			
-			transcriptResult, err = runWhisperTranscribe(videoFile)
-			if err != nil {
-				return fmt.Errorf("transcript extraction failed: %v", err)
+			frameResult, frameErr = runVideoFrames(stageCtx, videoFile)
+			if frameErr != nil {
+				frameErr = fmt.Errorf("frame extraction failed: %v", frameErr)
+				return
 			}
-		}
-		
-		if verbose {
-			fmt.Fprintf(os.Stderr, "Transcript extracted: %d segments\n", len(transcriptResult.Segments))
-		}
+			
+			if verbose {
+				fmt.Fprintf(os.Stderr, "Frames extracted: %d frames\n", frameResult.FrameCount)
+			}
+		}()
 	}
 
-	// Extract frames if not skipped
-	if !skipFrames {
-		if verbose {
-			fmt.Fprintf(os.Stderr, "Extracting frames...\n")
-		}
-		
-		frameResult, err = runVideoFrames(videoFile)
-		if err != nil {
-			return fmt.Errorf("frame extraction failed: %v", err)
+	wg.Wait()
+	// Restore default Ctrl-C handling for the caption stage
+	stop()
+	if transcriptErr != nil {
+		return transcriptErr
+	}
+	if frameErr != nil {
+		return frameErr
+	}
+
+	// Report the user's path rather than the staged copy
+	if stagedFrom != "" {
+		videoFile = stagedFrom
+		if !skipTranscript {
+			transcriptResult.SourceFile = stagedFrom
 		}
-		
-		if verbose {
-			fmt.Fprintf(os.Stderr, "Frames extracted: %d frames\n", frameResult.FrameCount)
+		if !skipFrames {
+			frameResult.SourceFile = stagedFrom
 		}
 	}
 
@@ -695,27 +792,43 @@ func createTradingAnalysisOutput(analysis VideoAnalysisInput, captions Processed
 }
 
 func runTranscribe(cmd *cobra.Command, args []string) error {
-	videoFile := args[0]
-
-	// Check if file exists
-	if _, err := os.Stat(videoFile); os.IsNotExist(err) {
-		return fmt.Errorf("file not found: %s", videoFile)
+	// Check that every file exists before starting any transcription
+	for _, videoFile := range args {
+		if _, err := os.Stat(videoFile); os.IsNotExist(err) {
+			return fmt.Errorf("file not found: %s", videoFile)
+		}
 	}
 
 	// Set global variables for transcription functions to use
 	whisperModel = transcribeModel
 	whisperBackend = transcribeBackend
+	whisperBeamSize = transcribeBeamSize
+	whisperBatchSize = transcribeBatchSize
+	whisperMLX4bit = transcribeMLX4bit
 
-	// Use the new Go-native transcription
-	result, err := runWhisperTranscribe(videoFile)
-	if err != nil {
-		return fmt.Errorf("transcription failed: %v", err)
-	}
+	var output []byte
+	if len(args) == 1 {
+		// Use the new Go-native transcription
+		result, err := runCachedWhisperTranscribe(args[0])
+		if err != nil {
+			return fmt.Errorf("transcription failed: %v", err)
+		}
 
-	// Convert result to JSON and output
-	output, err := json.MarshalIndent(result, "", "  ")
-	if err != nil {
-		return fmt.Errorf("failed to marshal output: %v", err)
+		// Convert result to JSON and output
+		output, err = json.MarshalIndent(result, "", "  ")
+		if err != nil {
+			return fmt.Errorf("failed to marshal output: %v", err)
+		}
+	} else {
+		results, err := transcribeFiles(args, transcribeJobs)
+		if err != nil {
+			return err
+		}
+
+		output, err = json.MarshalIndent(results, "", "  ")
+		if err != nil {
+			return fmt.Errorf("failed to marshal output: %v", err)
+		}
 	}
 
 	// Output the JSON to stdout for piping to Fabric
@@ -724,6 +837,60 @@ func runTranscribe(cmd *cobra.Command, args []string) error {
 	return nil
 }
 
+// transcribeFiles transcribes videoFiles with at most jobs running at once and
+// returns the transcripts in input order. Each job is a separate backend process
+// with its own model, so jobs only run in parallel on CPU backends, which split
+// the cores between them; GPU backends run one file at a time rather than load
+// several models onto one device. The first failure in input order is returned
+// once every job has finished.
+func transcribeFiles(videoFiles []string, jobs int) ([]TranscriptOutput, error) {
+	if jobs > len(videoFiles) {
+		jobs = len(videoFiles)
+	}
+	if jobs > 1 {
+		if backend := resolveWhisperBackend(); whisperBackendUsesGPU(backend) {
+			if verbose {
+				fmt.Fprintf(os.Stderr, "%s runs on the GPU; transcribing one file at a time\n", backend)
+			}
+			jobs = 1
+		}
+	}
+	if jobs < 1 {
+		jobs = 1
+	}
+	whisperConcurrentJobs = jobs
+
+	results := make([]TranscriptOutput, len(videoFiles))
+	errs := make([]error, len(videoFiles))
+	next := make(chan int)
+	var wg sync.WaitGroup
+
+	for w := 0; w < jobs; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range next {
+				if verbose {
+					fmt.Fprintf(os.Stderr, "Transcribing %s (%d/%d)...\n", videoFiles[i], i+1, len(videoFiles))
+				}
+				results[i], errs[i] = runCachedWhisperTranscribe(videoFiles[i])
+			}
+		}()
+	}
+	for i := range videoFiles {
+		next <- i
+	}
+	close(next)
+	wg.Wait()
+
+	for i, err := range errs {
+		if err != nil {
+			return nil, fmt.Errorf("transcription of %s failed: %v", videoFiles[i], err)
+		}
+	}
+	return results, nil
+}
+
 func runFrames(cmd *cobra.Command, args []string) error {
 	videoFile := args[0]
 
@@ -788,6 +955,67 @@ func runFrames(cmd *cobra.Command, args []string) error {
 	return nil
 }
 
+// commandContext is exec.CommandContext for helper scripts that spawn their own
+// children (yt-dlp, ffmpeg). With a cancellable ctx the script runs in its own
+// process group and cancellation kills the whole group, not just the script.
+func commandContext(ctx context.Context, name string, args ...string) *exec.Cmd {
+	cmd := exec.CommandContext(ctx, name, args...)
+	if ctx.Done() != nil {
+		cmd.SysProcAttr = &syscall.SysProcAttr{Setpgid: true}
+		cmd.Cancel = func() error {
+			return syscall.Kill(-cmd.Process.Pid, syscall.SIGKILL)
+		}
+	}
+	return cmd
+}
+
+// stageVideoLocally copies videoFile into a fresh temp directory and returns the
+// copy's path and a func that removes it
+func stageVideoLocally(videoFile string) (string, func(), error) {
+	src, err := os.Open(videoFile)
+	if err != nil {
+		return "", nil, err
+	}
+	defer src.Close()
+
+	tmpDir, err := os.MkdirTemp("", "screenscribe-stage-*")
+	if err != nil {
+		return "", nil, err
+	}
+	cleanup := func() { os.RemoveAll(tmpDir) }
+
+	stagedFile := filepath.Join(tmpDir, filepath.Base(videoFile))
+	dst, err := os.Create(stagedFile)
+	if err != nil {
+		cleanup()
+		return "", nil, err
+	}
+
+	start := time.Now()
+	written, err := io.Copy(dst, src)
+	if closeErr := dst.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		cleanup()
+		return "", nil, err
+	}
+
+	// Keep the source mtime: it is part of the transcript cache key
+	info, err := src.Stat()
+	if err == nil {
+		err = os.Chtimes(stagedFile, info.ModTime(), info.ModTime())
+	}
+	if err != nil && verbose {
+		fmt.Fprintf(os.Stderr, "Could not copy mtime to staged file, transcript cache will miss: %v\n", err)
+	}
+
+	if verbose {
+		fmt.Fprintf(os.Stderr, "Staged %s locally (%.1f MB in %.1fs)\n", videoFile, float64(written)/(1<<20), time.Since(start).Seconds())
+	}
+	return stagedFile, cleanup, nil
+}
+
 // Helper functions (reused from video_analyze)
 func isYouTubeURL(input string) bool {
 	// Common YouTube URL patterns
@@ -808,7 +1036,7 @@ func isYouTubeURL(input string) bool {
 	return false
 }
 
-func handleYouTubeURL(url string, useYouTubeTranscript bool) (string, error) {
+func handleYouTubeURL(ctx context.Context, url string, useYouTubeTranscript bool, videoOnly bool) (string, error) {
 	// Find youtube_helper executable
 	youtubeCmd, err := findExecutable("youtube_helper.py")
 	if err != nil {
@@ -822,12 +1050,16 @@ func handleYouTubeURL(url string, useYouTubeTranscript bool) (string, error) {
 		args = append(args, "--transcript-only")
 	}
 	
+	if videoOnly {
+		args = append(args, "--video-only")
+	}
+	
 	if verbose {
 		args = append(args, "--verbose")
 	}
 
 	// Execute youtube_helper
-	cmd := exec.Command("python3", append([]string{youtubeCmd}, args...)...)
+	cmd := commandContext(ctx, "python3", append([]string{youtubeCmd}, args...)...)
 	cmd.Stderr = os.Stderr
 	
 	output, err := cmd.Output()
@@ -841,9 +1073,16 @@ func handleYouTubeURL(url string, useYouTubeTranscript bool) (string, error) {
 
 func runWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
 	// Choose transcription backend based on platform and preference
-	switch whisperBackend {
+	return runWhisperBackend(whisperBackend, videoFile)
+}
+
+// runWhisperBackend runs the named backend; anything unrecognized means auto
+func runWhisperBackend(backend, videoFile string) (TranscriptOutput, error) {
+	switch backend {
 	case "mlx":
 		return runMLXWhisperTranscribe(videoFile)
+	case "whisper-cpp":
+		return runWhisperCppTranscribe(videoFile)
 	case "faster-whisper":
 		return runFasterWhisperTranscribe(videoFile)
 	case "openai-whisper":
@@ -853,28 +1092,51 @@ func runWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
 	}
 }
 
-// runMLXWhisperTranscribe runs MLX Whisper for Apple Silicon GPU acceleration
-func runMLXWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
-	var result TranscriptOutput
+// MLX whisper model mapping to HuggingFace repositories
+var mlxModelMap = map[string]string{
+	"tiny":     "mlx-community/whisper-tiny-mlx",
+	"base":     "mlx-community/whisper-base-mlx",
+	"small":    "mlx-community/whisper-small-mlx",
+	"medium":   "mlx-community/whisper-medium-mlx",
+	"large":    "mlx-community/whisper-large-v3-turbo", // Use fastest large model
+	"large-v2": "mlx-community/whisper-large-v2-mlx",
+	"large-v3": "mlx-community/whisper-large-v3-turbo", // Use fastest v3 model
+	// Distil-Whisper: distilled decoder, several times faster at near large-v3 accuracy (English)
+	"distil-large-v3": "mlx-community/distil-whisper-large-v3",
+}
 
-	// MLX whisper model mapping to HuggingFace repositories
-	mlxModelMap := map[string]string{
-		"tiny":     "mlx-community/whisper-tiny-mlx",
-		"base":     "mlx-community/whisper-base-mlx",
-		"small":    "mlx-community/whisper-small-mlx",
-		"medium":   "mlx-community/whisper-medium-mlx",
-		"large":    "mlx-community/whisper-large-v3-turbo", // Use fastest large model
-		"large-v2": "mlx-community/whisper-large-v2-mlx",
-		"large-v3": "mlx-community/whisper-large-v3-turbo", // Use fastest v3 model
-	}
+// 4-bit MLX variants halve decode memory traffic again; large/large-v3 already use turbo
+var mlx4bitModelMap = map[string]string{
+	"tiny":     "mlx-community/whisper-tiny-mlx-4bit",
+	"base":     "mlx-community/whisper-base-mlx-4bit",
+	"small":    "mlx-community/whisper-small-mlx-4bit",
+	"medium":   "mlx-community/whisper-medium-mlx-4bit",
+	"large-v2": "mlx-community/whisper-large-v2-mlx-4bit",
+}
 
+// runMLXWhisperTranscribe runs MLX Whisper for Apple Silicon GPU acceleration
+func runMLXWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
 	modelRepo, exists := mlxModelMap[whisperModel]
 	if !exists {
 		modelRepo = mlxModelMap["base"] // fallback to base
 	}
 
+	// The script falls back to modelRepo if the quantized repo can't be loaded
+	quantizedRepo := ""
+	if whisperMLX4bit {
+		quantizedRepo = mlx4bitModelMap[whisperModel]
+	}
+
 	// Build Python command to call MLX whisper directly
 	pythonScript := fmt.Sprintf(`
+import importlib.util
+import os
+
+# First use downloads the model from the Hugging Face Hub; use the Rust hf_transfer
+# downloader when installed (huggingface_hub errors if the flag is set without it)
+if importlib.util.find_spec("hf_transfer") is not None:
+	os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 import mlx_whisper
 import json
 import sys
@@ -882,23 +1144,27 @@ import time
 
 try:
 	start_time = time.time()
-	result = mlx_whisper.transcribe(
-		"%s",
-		path_or_hf_repo="%s",
-		word_timestamps=True
-	)
-	
-	# Format segments
-	segments_list = []
-	if "segments" in result:
-		for i, segment in enumerate(result["segments"]):
-			segment_dict = {
-				"id": i,
-				"start": segment.get("start", 0),
-				"end": segment.get("end", 0),
-				"text": segment.get("text", "").strip()
-			}
-			segments_list.append(segment_dict)
+	video_file = "%s"
+	model_repo = "%s"
+	quantized_repo = "%s"
+	
+	# Only segment-level timing is returned, so skip the extra word-alignment pass
+	result = None
+	if quantized_repo:
+		try:
+			result = mlx_whisper.transcribe(video_file, path_or_hf_repo=quantized_repo, word_timestamps=False)
+			model_repo = quantized_repo
+		except Exception as e:
+			if %s:
+				print(f"MLX Whisper: 4-bit model unavailable ({e}), using {model_repo}", file=sys.stderr)
+	if result is None:
+		result = mlx_whisper.transcribe(video_file, path_or_hf_repo=model_repo, word_timestamps=False)
+	
+	# Format segments; mlx_whisper always fills start/end/text, so index them directly
+	segments_list = [
+		{"id": i, "start": segment["start"], "end": segment["end"], "text": segment["text"].strip()}
+		for i, segment in enumerate(result.get("segments", ()))
+	]
 	
 	output = {
 		"text": result.get("text", ""),
@@ -914,7 +1180,12 @@ try:
 	if %s:
 		print(f"MLX Whisper: Processed in {time.time() - start_time:.1f}s, {len(segments_list)} segments", file=sys.stderr)
 	
-	print(json.dumps(output, indent=2, ensure_ascii=False))
+	# Go re-encodes this output, so skip indentation and prefer orjson when installed
+	try:
+		import orjson
+		sys.stdout.buffer.write(orjson.dumps(output))
+	except (ImportError, TypeError):
+		print(json.dumps(output, ensure_ascii=False))
 
 except ImportError as e:
 	print(f"Error: MLX Whisper not available: {e}", file=sys.stderr)
@@ -927,74 +1198,101 @@ except Exception as e:
 	else:
 		print(f"Error: MLX Whisper transcription failed: {e}", file=sys.stderr)
 	sys.exit(1)
-`, videoFile, modelRepo, videoFile, whisperModel, pythonBool(verbose))
-
-	// Execute the Python script
-	cmd := exec.Command("python3", "-c", pythonScript)
-	if verbose {
-		cmd.Stderr = os.Stderr
-	}
+`, videoFile, modelRepo, quantizedRepo, pythonBool(verbose), videoFile, whisperModel, pythonBool(verbose))
 
-	output, err := cmd.Output()
-	if err != nil {
-		return result, fmt.Errorf("MLX whisper transcription failed: %v", err)
-	}
-
-	// Parse JSON output
-	if err := json.Unmarshal(output, &result); err != nil {
-		return result, fmt.Errorf("failed to parse MLX whisper output: %v", err)
-	}
-
-	return result, nil
+	return runTranscriptScript(pythonScript, "MLX whisper")
 }
 
 // runFasterWhisperTranscribe runs faster-whisper backend
 func runFasterWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
-	var result TranscriptOutput
-
 	pythonScript := fmt.Sprintf(`
+import importlib.util
 import json
+import os
+import platform
 import sys
 import time
-import platform
+
+# First use downloads the model from the Hugging Face Hub; use the Rust hf_transfer
+# downloader when installed (huggingface_hub errors if the flag is set without it)
+if importlib.util.find_spec("hf_transfer") is not None:
+	os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 try:
+	import ctranslate2
 	from faster_whisper import WhisperModel
 	
-	# Configure device and compute type based on platform
-	device = "auto"
-	
-	# Use appropriate compute type for Apple Silicon
-	if platform.system() == "Darwin" and platform.machine() == "arm64":
-		compute_type = "int8"  # On Apple Silicon, use int8 for faster-whisper
+	# Configure device and compute type based on available hardware
+	if ctranslate2.get_cuda_device_count() > 0:
+		device = "cuda"
+		# int8 weights with float16 activations use the int8 tensor-core paths
+		supported = ctranslate2.get_supported_compute_types("cuda")
+		compute_type = "int8_float16" if "int8_float16" in supported else "float16"
 	else:
-		compute_type = "float16"  # On other platforms, float16 works fine
+		device = "cpu"
+		# int8 is the fast path on x86; ARM CPUs with FP16 arithmetic can keep int8 weights
+		# with float16 activations when this ctranslate2 build supports it
+		compute_type = "int8"
+		if platform.machine() in ("arm64", "aarch64"):
+			if "int8_float16" in ctranslate2.get_supported_compute_types("cpu"):
+				compute_type = "int8_float16"
 	
 	start_time = time.time()
-	whisper_model = WhisperModel("%s", device=device, compute_type=compute_type)
-	
-	segments, info = whisper_model.transcribe(
+	# 0 lets CTranslate2 decide (it honors OMP_NUM_THREADS)
+	cpu_threads = %d
+	whisper_model = WhisperModel("%s", device=device, compute_type=compute_type, cpu_threads=cpu_threads)
+	
+	# Batch the VAD chunks of the file through the model (faster-whisper >= 1.1);
+	# CPU gets a smaller batch by default to bound memory use, and a batch size
+	# of 1 keeps the sequential decoder
+	batch_size = %d or (16 if device == "cuda" else 4)
+	transcriber = whisper_model
+	transcribe_kwargs = {}
+	if batch_size > 1:
+		try:
+			from faster_whisper import BatchedInferencePipeline
+			transcriber = BatchedInferencePipeline(model=whisper_model)
+			transcribe_kwargs["batch_size"] = batch_size
+		except ImportError:
+			pass
+	if transcriber is whisper_model:
+		# Decode windows independently, as the batched pipeline does
+		transcribe_kwargs["condition_on_previous_text"] = False
+	
+	# Greedy decoding by default (beam size 1); --beam-size opts back into beam search
+	beam_size = %d
+	segments, info = transcriber.transcribe(
 		"%s",
+		beam_size=beam_size,
+		best_of=beam_size,
 		vad_filter=True,
-		vad_parameters=dict(min_silence_duration_ms=500)
+		vad_parameters=dict(min_silence_duration_ms=500, speech_pad_ms=200),
+		**transcribe_kwargs
 	)
 	
-	# Convert segments to list
+	# Convert segments to list, collecting the stripped text once for the final join.
+	# segments is a lazy generator, so decoding happens here and progress can be reported as it goes
+	show_progress = %s
 	segments_list = []
-	full_text = ""
+	segment_texts = []
 	
 	for i, segment in enumerate(segments):
-		segment_dict = {
+		text = segment.text.strip()
+		segments_list.append({
 			"id": i,
 			"start": segment.start,
 			"end": segment.end,
-			"text": segment.text.strip()
-		}
-		segments_list.append(segment_dict)
-		full_text += segment.text.strip() + " "
+			"text": text
+		})
+		segment_texts.append(text)
+		if show_progress and info.duration:
+			print(f"\rFaster Whisper: {min(segment.end / info.duration, 1.0):.0%%} transcribed", end="", file=sys.stderr, flush=True)
+	
+	if show_progress and info.duration:
+		print(file=sys.stderr)
 	
 	output = {
-		"text": full_text.strip(),
+		"text": " ".join(segment_texts),
 		"segments": segments_list,
 		"language": info.language,
 		"duration": segments_list[-1]["end"] if segments_list else 0,
@@ -1007,7 +1305,12 @@ try:
 	if %s:
 		print(f"Faster Whisper: Processed in {time.time() - start_time:.1f}s, {len(segments_list)} segments", file=sys.stderr)
 	
-	print(json.dumps(output, indent=2, ensure_ascii=False))
+	# Go re-encodes this output, so skip indentation and prefer orjson when installed
+	try:
+		import orjson
+		sys.stdout.buffer.write(orjson.dumps(output))
+	except (ImportError, TypeError):
+		print(json.dumps(output, ensure_ascii=False))
 
 except ImportError:
 	print("Error: faster-whisper not available", file=sys.stderr)
@@ -1015,48 +1318,168 @@ except ImportError:
 except Exception as e:
 	print(f"Error: Faster whisper transcription failed: {e}", file=sys.stderr)
 	sys.exit(1)
-`, whisperModel, videoFile, videoFile, whisperModel, pythonBool(verbose))
+`, whisperCPUThreads(), whisperModel, whisperBatchSize, whisperBeamSize, videoFile, pythonBool(verbose), videoFile, whisperModel, pythonBool(verbose))
 
-	// Execute the Python script
-	cmd := exec.Command("python3", "-c", pythonScript)
-	if verbose {
-		cmd.Stderr = os.Stderr
+	return runTranscriptScript(pythonScript, "faster-whisper")
+}
+
+// whisperConcurrentJobs is how many backend processes share the CPU (transcribe --jobs)
+var whisperConcurrentJobs = 1
+
+// whisperCPUThreads returns the CPU thread count for the Whisper backends, or 0 to
+// leave it to the library. On Apple Silicon it is the performance-core count:
+// threads scheduled onto efficiency cores hold back the whole matmul. Concurrent
+// jobs split the cores between them instead of each claiming all of them.
+// An explicit OMP_NUM_THREADS always wins.
+func whisperCPUThreads() int {
+	if os.Getenv("OMP_NUM_THREADS") != "" {
+		return 0
 	}
 
-	output, err := cmd.Output()
-	if err != nil {
-		return result, fmt.Errorf("faster-whisper transcription failed: %v", err)
+	cores := 0
+	if runtime.GOOS == "darwin" && runtime.GOARCH == "arm64" {
+		if output, err := exec.Command("sysctl", "-n", "hw.perflevel0.logicalcpu").Output(); err == nil {
+			if n, err := strconv.Atoi(strings.TrimSpace(string(output))); err == nil && n > 0 {
+				cores = n
+			}
+		}
 	}
 
-	// Parse JSON output
-	if err := json.Unmarshal(output, &result); err != nil {
-		return result, fmt.Errorf("failed to parse faster-whisper output: %v", err)
+	if whisperConcurrentJobs > 1 {
+		if cores == 0 {
+			cores = runtime.NumCPU()
+		}
+		cores /= whisperConcurrentJobs
+		if cores < 1 {
+			cores = 1
+		}
+	}
+	return cores
+}
+
+// runWhisperCppTranscribe runs whisper.cpp through pywhispercpp, whose CPU path uses
+// Accelerate (AMX) on Apple Silicon where CTranslate2 only has NEON
+func runWhisperCppTranscribe(videoFile string) (TranscriptOutput, error) {
+	// whisper.cpp ggml model names; large maps to turbo as for MLX, and so does
+	// distil-large-v3, which has no ggml build in pywhispercpp's model list
+	cppModelMap := map[string]string{
+		"large":           "large-v3-turbo",
+		"large-v3":        "large-v3-turbo",
+		"distil-large-v3": "large-v3-turbo",
+	}
+	modelName, exists := cppModelMap[whisperModel]
+	if !exists {
+		modelName = whisperModel
 	}
 
-	return result, nil
+	pythonScript := fmt.Sprintf(`
+import json
+import os
+import sys
+import time
+
+try:
+	from pywhispercpp.model import Model
+	
+	start_time = time.time()
+	whisper_model = Model("%s", n_threads=%d or os.cpu_count() or 4, print_progress=False, print_realtime=False)
+	segments = whisper_model.transcribe("%s")
+	
+	# whisper.cpp timestamps are in 10ms units
+	segments_list = [
+		{"id": i, "start": segment.t0 / 100.0, "end": segment.t1 / 100.0, "text": segment.text.strip()}
+		for i, segment in enumerate(segments)
+	]
+	
+	output = {
+		"text": " ".join(segment["text"] for segment in segments_list),
+		"segments": segments_list,
+		"language": "unknown",
+		"duration": segments_list[-1]["end"] if segments_list else 0,
+		"backend": "whisper-cpp",
+		"source_file": "%s",
+		"model": "%s",
+		"timestamp": time.time()
+	}
+	
+	if %s:
+		print(f"whisper.cpp: Processed in {time.time() - start_time:.1f}s, {len(segments_list)} segments", file=sys.stderr)
+	
+	# Go re-encodes this output, so skip indentation and prefer orjson when installed
+	try:
+		import orjson
+		sys.stdout.buffer.write(orjson.dumps(output))
+	except (ImportError, TypeError):
+		print(json.dumps(output, ensure_ascii=False))
+
+except ImportError:
+	print("Error: pywhispercpp not available", file=sys.stderr)
+	sys.exit(1)
+except Exception as e:
+	print(f"Error: whisper.cpp transcription failed: {e}", file=sys.stderr)
+	sys.exit(1)
+`, modelName, whisperCPUThreads(), videoFile, videoFile, whisperModel, pythonBool(verbose))
+
+	return runTranscriptScript(pythonScript, "whisper.cpp")
 }
 
 // runOpenAIWhisperTranscribe runs original OpenAI Whisper (fallback)
 func runOpenAIWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
-	var result TranscriptOutput
-
 	pythonScript := fmt.Sprintf(`
 import json
+import os
 import sys
 import time
 
+# Let MPS run the few Whisper ops Metal lacks on the CPU instead of raising
+os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
+
 try:
+	import torch
 	import whisper
 	
+	# openai-whisper ships no distilled checkpoints; its pruned-decoder turbo model
+	# (large-v3 on releases before turbo) is the closest equivalent
+	model_name = "%s"
+	if model_name == "distil-large-v3":
+		model_name = "turbo" if "turbo" in whisper.available_models() else "large-v3"
+	
 	start_time = time.time()
-	whisper_model = whisper.load_model("%s")
-	result = whisper_model.transcribe("%s")
+	if torch.cuda.is_available():
+		device = "cuda"
+	elif torch.backends.mps.is_available():
+		device = "mps"
+	else:
+		device = "cpu"
+	
+	# 0 leaves torch's default (all cores); set when jobs share the CPU
+	cpu_threads = %d
+	if cpu_threads:
+		torch.set_num_threads(cpu_threads)
+	
+	try:
+		whisper_model = whisper.load_model(model_name, device=device)
+		result = whisper_model.transcribe("%s", fp16=(device == "cuda"))
+	except (NotImplementedError, RuntimeError) as e:
+		if device != "mps":
+			raise
+		if %s:
+			print(f"OpenAI Whisper: MPS failed ({e}), retrying on CPU", file=sys.stderr)
+		device = "cpu"
+		whisper_model = whisper.load_model(model_name, device=device)
+		result = whisper_model.transcribe("%s", fp16=False)
+	
+	# Keep only the fields Go reads; raw segments also carry token ids and decoder stats
+	segments_list = [
+		{"id": i, "start": segment["start"], "end": segment["end"], "text": segment["text"].strip()}
+		for i, segment in enumerate(result["segments"])
+	]
 	
 	output = {
 		"text": result["text"],
-		"segments": result["segments"],
+		"segments": segments_list,
 		"language": result["language"],
-		"duration": result["segments"][-1]["end"] if result["segments"] else 0,
+		"duration": segments_list[-1]["end"] if segments_list else 0,
 		"backend": "openai-whisper",
 		"source_file": "%s",
 		"model": "%s", 
@@ -1064,9 +1487,14 @@ try:
 	}
 	
 	if %s:
-		print(f"OpenAI Whisper: Processed in {time.time() - start_time:.1f}s, {len(result['segments'])} segments", file=sys.stderr)
+		print(f"OpenAI Whisper: Processed in {time.time() - start_time:.1f}s on {device}, {len(segments_list)} segments", file=sys.stderr)
 	
-	print(json.dumps(output, indent=2, ensure_ascii=False))
+	# Go re-encodes this output, so skip indentation and prefer orjson when installed
+	try:
+		import orjson
+		sys.stdout.buffer.write(orjson.dumps(output))
+	except (ImportError, TypeError):
+		print(json.dumps(output, ensure_ascii=False))
 
 except ImportError:
 	print("Error: openai-whisper not available", file=sys.stderr)
@@ -1074,9 +1502,16 @@ except ImportError:
 except Exception as e:
 	print(f"Error: OpenAI whisper transcription failed: {e}", file=sys.stderr)
 	sys.exit(1)
-`, whisperModel, videoFile, videoFile, whisperModel, pythonBool(verbose))
+`, whisperModel, whisperCPUThreads(), videoFile, pythonBool(verbose), videoFile, videoFile, whisperModel, pythonBool(verbose))
+
+	return runTranscriptScript(pythonScript, "OpenAI whisper")
+}
+
+// runTranscriptScript executes an embedded Whisper backend script and decodes the
+// TranscriptOutput JSON it prints; name is the backend label used in errors
+func runTranscriptScript(pythonScript, name string) (TranscriptOutput, error) {
+	var result TranscriptOutput
 
-	// Execute the Python script
 	cmd := exec.Command("python3", "-c", pythonScript)
 	if verbose {
 		cmd.Stderr = os.Stderr
@@ -1084,41 +1519,206 @@ except Exception as e:
 
 	output, err := cmd.Output()
 	if err != nil {
-		return result, fmt.Errorf("OpenAI whisper transcription failed: %v", err)
+		return result, fmt.Errorf("%s transcription failed: %v", name, err)
 	}
 
 	// Parse JSON output
 	if err := json.Unmarshal(output, &result); err != nil {
-		return result, fmt.Errorf("failed to parse OpenAI whisper output: %v", err)
+		return result, fmt.Errorf("failed to parse %s output: %v", name, err)
 	}
 
 	return result, nil
 }
 
+// backendProbeCache is the on-disk form of a backend probe result
+type backendProbeCache struct {
+	Python string `json:"python"`
+	// SitePackages maps each import directory to its mtime (0 if it did not exist);
+	// pip adds or removes entries there, which invalidates the cached result
+	SitePackages map[string]int64 `json:"site_packages"`
+	Installed    []string         `json:"installed"`
+}
+
+// sitePackagesUnchanged reports whether every recorded import directory still
+// has the mtime it had when the probe ran
+func sitePackagesUnchanged(dirs map[string]int64) bool {
+	if len(dirs) == 0 {
+		return false
+	}
+	for dir, modTime := range dirs {
+		info, err := os.Stat(dir)
+		if err != nil {
+			if modTime != 0 {
+				return false
+			}
+			continue
+		}
+		if info.ModTime().UnixNano() != modTime {
+			return false
+		}
+	}
+	return true
+}
+
+// installedWhisperBackends reports which Python Whisper backends can be imported.
+// The probe result is cached per python3 binary until the interpreter's
+// site-packages change (pip install or uninstall), so repeated runs skip the
+// interpreter launch without missing a newly installed backend; an empty result
+// is never reused.
+// It returns nil if the probe itself fails, meaning every backend should be tried.
+func installedWhisperBackends() map[string]bool {
+	python, _ := exec.LookPath("python3")
+	key := backendProbeCache{Python: python}
+
+	var cachePath string
+	if base, err := os.UserCacheDir(); err == nil {
+		cachePath = filepath.Join(base, "screenscribe", "backends.json")
+		var cached backendProbeCache
+		if data, err := os.ReadFile(cachePath); err == nil && json.Unmarshal(data, &cached) == nil &&
+			cached.Python == key.Python && len(cached.Installed) > 0 &&
+			sitePackagesUnchanged(cached.SitePackages) {
+			installed := make(map[string]bool)
+			for _, backend := range cached.Installed {
+				installed[backend] = true
+			}
+			return installed
+		}
+	}
+
+	installed, siteDirs := probeWhisperBackends()
+	if installed != nil && cachePath != "" && len(siteDirs) > 0 {
+		key.SitePackages = make(map[string]int64)
+		for _, dir := range siteDirs {
+			// Stat before trusting the result, so an install racing the probe
+			// shows up as a changed mtime on the next run
+			if info, err := os.Stat(dir); err == nil {
+				key.SitePackages[dir] = info.ModTime().UnixNano()
+			} else {
+				key.SitePackages[dir] = 0
+			}
+		}
+		for backend := range installed {
+			key.Installed = append(key.Installed, backend)
+		}
+		if data, err := json.Marshal(key); err == nil {
+			// Concurrent analyze stages and --jobs workers may probe at once
+			if os.MkdirAll(filepath.Dir(cachePath), 0755) == nil {
+				writeFileAtomic(cachePath, data)
+			}
+		}
+	}
+	return installed
+}
+
+// probeWhisperBackends checks backend availability with a single interpreter
+// launch and find_spec, so no backend is actually loaded. It also returns the
+// interpreter's site-packages directories, whose mtimes key the probe cache.
+func probeWhisperBackends() (map[string]bool, []string) {
+	probe := `
+import importlib.util
+import site
+import sysconfig
+paths = sysconfig.get_paths()
+for site_dir in {paths["purelib"], paths["platlib"], site.getusersitepackages()}:
+	print("site:" + site_dir)
+for backend, module in (("mlx", "mlx_whisper"), ("whisper-cpp", "pywhispercpp"), ("faster-whisper", "faster_whisper"), ("openai-whisper", "whisper")):
+	if importlib.util.find_spec(module) is not None:
+		print(backend)
+`
+	output, err := exec.Command("python3", "-c", probe).Output()
+	if err != nil {
+		return nil, nil
+	}
+
+	installed := make(map[string]bool)
+	var siteDirs []string
+	for _, line := range strings.Split(string(output), "\n") {
+		line = strings.TrimSpace(line)
+		if dir, ok := strings.CutPrefix(line, "site:"); ok {
+			siteDirs = append(siteDirs, dir)
+		} else if line != "" {
+			installed[line] = true
+		}
+	}
+	return installed, siteDirs
+}
+
+// resolveWhisperBackend returns the backend a run will use: the requested one, or
+// for auto the first installed backend in auto order ("" if none is known)
+func resolveWhisperBackend() string {
+	switch whisperBackend {
+	case "mlx", "whisper-cpp", "faster-whisper", "openai-whisper":
+		return whisperBackend
+	}
+	if order := autoWhisperBackendOrder(installedWhisperBackends()); len(order) > 0 {
+		return order[0]
+	}
+	return ""
+}
+
+// whisperBackendUsesGPU reports whether backend runs inference on a GPU, where
+// concurrent jobs would each load a model onto the same device
+func whisperBackendUsesGPU(backend string) bool {
+	appleSilicon := runtime.GOOS == "darwin" && runtime.GOARCH == "arm64"
+	_, err := os.Stat("/dev/nvidiactl")
+	nvidia := err == nil
+
+	switch backend {
+	case "whisper-cpp":
+		return appleSilicon // Metal build
+	case "faster-whisper":
+		return nvidia
+	case "openai-whisper":
+		return appleSilicon || nvidia // MPS or CUDA
+	default: // mlx, or unknown
+		return true
+	}
+}
+
+// autoWhisperBackendOrder lists the backends auto mode tries, fastest first, out of
+// those installed; a nil installed set (probe failed) means every one is tried
+func autoWhisperBackendOrder(installed map[string]bool) []string {
+	available := func(backend string) bool {
+		return installed == nil || installed[backend]
+	}
+
+	var order []string
+	if runtime.GOOS == "darwin" && runtime.GOARCH == "arm64" {
+		// Try MLX first on Apple Silicon for best performance
+		if available("mlx") {
+			order = append(order, "mlx")
+		}
+		// On Apple Silicon CPUs whisper.cpp (Accelerate/AMX) beats CTranslate2's NEON path
+		if installed["whisper-cpp"] {
+			order = append(order, "whisper-cpp")
+		}
+	}
+	// faster-whisper works on all platforms; OpenAI Whisper is the final fallback
+	for _, backend := range []string{"faster-whisper", "openai-whisper"} {
+		if available(backend) {
+			order = append(order, backend)
+		}
+	}
+	return order
+}
+
 // runAutoWhisperTranscribe auto-selects best transcription backend for current platform
 func runAutoWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
-	// Try MLX first on Apple Silicon for best performance
-	if runtime.GOOS == "darwin" && runtime.GOARCH == "arm64" {
-		result, err := runMLXWhisperTranscribe(videoFile)
+	// Skip backends that are not installed instead of launching them just to fail
+	order := autoWhisperBackendOrder(installedWhisperBackends())
+	lastErr := fmt.Errorf("no Whisper backend installed (pip install mlx-whisper, faster-whisper or openai-whisper)")
+
+	for i, backend := range order {
+		result, err := runWhisperBackend(backend, videoFile)
 		if err == nil {
 			return result, nil
 		}
-		if verbose {
-			fmt.Fprintf(os.Stderr, "MLX failed, falling back to faster-whisper: %v\n", err)
+		lastErr = err
+		if verbose && i+1 < len(order) {
+			fmt.Fprintf(os.Stderr, "%s failed, falling back to %s: %v\n", backend, order[i+1], err)
 		}
 	}
-	
-	// Fall back to faster-whisper (works on all platforms)
-	result, err := runFasterWhisperTranscribe(videoFile)
-	if err == nil {
-		return result, nil
-	}
-	if verbose {
-		fmt.Fprintf(os.Stderr, "Faster-whisper failed, falling back to OpenAI whisper: %v\n", err)
-	}
-	
-	// Final fallback to OpenAI Whisper
-	return runOpenAIWhisperTranscribe(videoFile)
+	return TranscriptOutput{}, lastErr
 }
 
 func runYouTubeTranscribe(youtubeURL string) (TranscriptOutput, error) {
@@ -1157,7 +1757,7 @@ func runYouTubeTranscribe(youtubeURL string) (TranscriptOutput, error) {
 	return result, nil
 }
 
-func runVideoFrames(videoFile string) (FrameOutput, error) {
+func runVideoFrames(ctx context.Context, videoFile string) (FrameOutput, error) {
 	var result FrameOutput
 
 	// Find extract_frames script
@@ -1197,7 +1797,7 @@ func runVideoFrames(videoFile string) (FrameOutput, error) {
 	args = append(args, videoFile)
 
 	// Execute extract_frames script
-	cmd := exec.Command("bash", args...)
+	cmd := commandContext(ctx, "bash", args...)
 	cmd.Stderr = os.Stderr
 	
 	output, err := cmd.Output()
@@ -1247,7 +1847,7 @@ func runCaptions(cmd *cobra.Command, args []string) error {
 				fmt.Fprintf(os.Stderr, "Extracting frames from video: %s\n", input)
 			}
 			
-			frameResult, err := runVideoFrames(input)
+			frameResult, err := runVideoFrames(context.Background(), input)
 			if err != nil {
 				return fmt.Errorf("frame extraction failed: %v", err)
 			}
@@ -1505,13 +2105,9 @@ func findExecutable(name string) (string, error) {
 		}
 	}
 
-	// Try using which command
-	cmd := exec.Command("which", name)
-	if output, err := cmd.Output(); err == nil {
-		path := strings.TrimSpace(string(output))
-		if path != "" {
-			return path, nil
-		}
+	// Search PATH without forking which
+	if path, err := exec.LookPath(name); err == nil {
+		return path, nil
 	}
 
 	return "", fmt.Errorf("%s not found in any expected location", name)
@@ -1547,13 +2143,9 @@ func findFrameScript() (string, error) {
 		}
 	}
 
-	// Try to find using which command
-	cmd := exec.Command("which", "extract_frames.sh")
-	if output, err := cmd.Output(); err == nil {
-		path := strings.TrimSpace(string(output))
-		if path != "" {
-			return path, nil
-		}
+	// Search PATH without forking which
+	if path, err := exec.LookPath("extract_frames.sh"); err == nil {
+		return path, nil
 	}
 
 	return "", fmt.Errorf("extract_frames.sh not found in any expected location")
@@ -318,7 +318,7 @@ func (c *OllamaClient) CaptionFramesParallel(ctx context.Context, frames []Frame
 	
 	for result := range resultChan {
 		if result.err != nil {
-			errors = append(errors, fmt.Errorf("frame %s: %w", result.frameID, result.err))
+			errors = append(errors, fmt.Errorf("frame frame_%d: %w", result.frameNumber, result.err))
 		} else {
 			results = append(results, result.caption)
 		}
@@ -333,10 +333,11 @@ func (c *OllamaClient) CaptionFramesParallel(ctx context.Context, frames []Frame
 }
 
 // captionResult holds the result of captioning a single frame
+// The frame number is kept raw and only formatted when reporting an error.
 type captionResult struct {
-	frameID string
-	caption FrameCaption
-	err     error
+	frameNumber int
+	caption     FrameCaption
+	err         error
 }
 
 // captionWorker processes frames from the channel
@@ -364,8 +365,8 @@ func (c *OllamaClient) captionWorker(ctx context.Context, frameChan <-chan Frame
 
 			if err != nil {
 				resultChan <- captionResult{
-					frameID: fmt.Sprintf("frame_%d", frame.FrameNumber),
-					err:     err,
+					frameNumber: frame.FrameNumber,
+					err:         err,
 				}
 				continue
 			}
@@ -374,8 +375,8 @@ func (c *OllamaClient) captionWorker(ctx context.Context, frameChan <-chan Frame
 			caption, err := c.CaptionImage(ctx, imageData, model, "")
 			if err != nil {
 				resultChan <- captionResult{
-					frameID: fmt.Sprintf("frame_%d", frame.FrameNumber),
-					err:     err,
+					frameNumber: frame.FrameNumber,
+					err:         err,
 				}
 				continue
 			}
@@ -385,8 +386,8 @@ func (c *OllamaClient) captionWorker(ctx context.Context, frameChan <-chan Frame
 			caption.Timestamp = float64(frame.Timestamp)
 
 			resultChan <- captionResult{
-				frameID: fmt.Sprintf("frame_%d", frame.FrameNumber),
-				caption: *caption,
+				frameNumber: frame.FrameNumber,
+				caption:     *caption,
 			}
 
 		case <-ctx.Done():
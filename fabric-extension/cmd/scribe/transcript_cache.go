@@ -0,0 +1,215 @@
+package main
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+)
+
+// Transcript cache settings
+const (
+	transcriptCacheSampleSize = 4 << 20 // bytes hashed from each end of the media file
+	transcriptCacheMaxEntries = 200
+)
+
+// noTranscriptCache disables the on-disk transcript cache (--no-cache)
+var noTranscriptCache bool
+
+// transcriptCacheDir returns the directory holding cached transcripts
+func transcriptCacheDir() (string, error) {
+	base, err := os.UserCacheDir()
+	if err != nil {
+		return "", err
+	}
+	return filepath.Join(base, "screenscribe", "transcripts"), nil
+}
+
+// transcriptFileFingerprint identifies a media file by its size, modification time
+// and its first and last 4MB. Hashing the ends rather than the whole file keeps
+// lookups fast on multi-GB videos; the mtime catches same-length edits to the
+// unhashed middle (e.g. rewritten PCM audio).
+func transcriptFileFingerprint(videoFile string) (string, error) {
+	f, err := os.Open(videoFile)
+	if err != nil {
+		return "", err
+	}
+	defer f.Close()
+
+	info, err := f.Stat()
+	if err != nil {
+		return "", err
+	}
+
+	h := sha256.New()
+	fmt.Fprintf(h, "%d\x00%d\x00", info.Size(), info.ModTime().UnixNano())
+
+	if _, err := io.CopyN(h, f, transcriptCacheSampleSize); err != nil && err != io.EOF {
+		return "", err
+	}
+	if info.Size() > 2*transcriptCacheSampleSize {
+		if _, err := f.Seek(-transcriptCacheSampleSize, io.SeekEnd); err != nil {
+			return "", err
+		}
+		if _, err := io.Copy(h, f); err != nil {
+			return "", err
+		}
+	} else if info.Size() > transcriptCacheSampleSize {
+		if _, err := io.Copy(h, f); err != nil {
+			return "", err
+		}
+	}
+
+	return hex.EncodeToString(h.Sum(nil)), nil
+}
+
+// transcriptCacheKey combines a file fingerprint with the backend that produces
+// the transcript and only the settings that backend actually reads
+func transcriptCacheKey(fingerprint, backend string) string {
+	settings := backend + "\x00" + whisperModel
+	switch backend {
+	case "mlx":
+		// Models without a 4-bit repo ignore the flag
+		settings += fmt.Sprintf("\x00%t", whisperMLX4bit && mlx4bitModelMap[whisperModel] != "")
+	case "faster-whisper":
+		// Batch size 1 switches to the sequential decoder, which segments
+		// differently; larger batch sizes only change throughput
+		settings += fmt.Sprintf("\x00%d\x00%t", whisperBeamSize, whisperBatchSize == 1)
+	}
+
+	h := sha256.Sum256([]byte(fingerprint + "\x00" + settings))
+	return hex.EncodeToString(h[:])
+}
+
+// transcriptCacheBackend maps the backend label a script reports to its flag name
+func transcriptCacheBackend(resultBackend string) string {
+	if resultBackend == "mlx-whisper" {
+		return "mlx"
+	}
+	return resultBackend
+}
+
+// runCachedWhisperTranscribe returns a cached transcript for videoFile when one
+// exists, otherwise transcribes it and stores the result. Auto mode is resolved to
+// the backend it would try first, so installing a faster backend invalidates
+// transcripts made by a slower one; results are stored under the backend that
+// actually ran. Cache failures never fail the transcription; they only cost the
+// cache hit.
+func runCachedWhisperTranscribe(videoFile string) (TranscriptOutput, error) {
+	if noTranscriptCache {
+		return runWhisperTranscribe(videoFile)
+	}
+
+	cacheDir, err := transcriptCacheDir()
+	var fingerprint string
+	if err == nil {
+		fingerprint, err = transcriptFileFingerprint(videoFile)
+	}
+	if err != nil {
+		if verbose {
+			fmt.Fprintf(os.Stderr, "Transcript cache unavailable: %v\n", err)
+		}
+		return runWhisperTranscribe(videoFile)
+	}
+
+	if backend := resolveWhisperBackend(); backend != "" {
+		cachePath := filepath.Join(cacheDir, transcriptCacheKey(fingerprint, backend)+".json")
+		if data, err := os.ReadFile(cachePath); err == nil {
+			var cached TranscriptOutput
+			if err := json.Unmarshal(data, &cached); err == nil {
+				if verbose {
+					fmt.Fprintf(os.Stderr, "Using cached transcript: %s\n", cachePath)
+				}
+				cached.SourceFile = videoFile
+				// Refresh mtime so pruning keeps recently used entries
+				now := time.Now()
+				os.Chtimes(cachePath, now, now)
+				return cached, nil
+			}
+		}
+	}
+
+	result, err := runWhisperTranscribe(videoFile)
+	if err != nil {
+		return result, err
+	}
+
+	cachePath := filepath.Join(cacheDir, transcriptCacheKey(fingerprint, transcriptCacheBackend(result.Backend))+".json")
+	if err := storeCachedTranscript(cacheDir, cachePath, result); err != nil && verbose {
+		fmt.Fprintf(os.Stderr, "Failed to cache transcript: %v\n", err)
+	}
+	return result, nil
+}
+
+// storeCachedTranscript writes result atomically and prunes the oldest entries
+func storeCachedTranscript(cacheDir, cachePath string, result TranscriptOutput) error {
+	if err := os.MkdirAll(cacheDir, 0755); err != nil {
+		return err
+	}
+
+	data, err := json.Marshal(result)
+	if err != nil {
+		return err
+	}
+
+	if err := writeFileAtomic(cachePath, data); err != nil {
+		return err
+	}
+
+	pruneTranscriptCache(cacheDir)
+	return nil
+}
+
+// writeFileAtomic writes data to a temp file beside path and renames it into
+// place, so concurrent readers never see a partially written file
+func writeFileAtomic(path string, data []byte) error {
+	tmp, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+"-*.tmp")
+	if err != nil {
+		return err
+	}
+	if _, err := tmp.Write(data); err != nil {
+		tmp.Close()
+		os.Remove(tmp.Name())
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmp.Name())
+		return err
+	}
+	if err := os.Rename(tmp.Name(), path); err != nil {
+		os.Remove(tmp.Name())
+		return err
+	}
+	return nil
+}
+
+// pruneTranscriptCache keeps the most recently used transcriptCacheMaxEntries entries
+func pruneTranscriptCache(cacheDir string) {
+	entries, err := filepath.Glob(filepath.Join(cacheDir, "*.json"))
+	if err != nil || len(entries) <= transcriptCacheMaxEntries {
+		return
+	}
+
+	type cacheEntry struct {
+		path    string
+		modTime int64
+	}
+	var files []cacheEntry
+	for _, path := range entries {
+		if info, err := os.Stat(path); err == nil {
+			files = append(files, cacheEntry{path, info.ModTime().UnixNano()})
+		}
+	}
+
+	sort.Slice(files, func(i, j int) bool {
+		return files[i].modTime > files[j].modTime
+	})
+	for i := transcriptCacheMaxEntries; i < len(files); i++ {
+		os.Remove(files[i].path)
+	}
+}
@@ -39,12 +39,27 @@ OUTPUT:
 EOF
 }
 
-# Function to get video metadata
+# Function to get video duration; asks ffprobe for the container duration only
+# instead of dumping every stream as JSON
 get_video_info() {
     local video_file="$1"
+    local duration
+    
+    duration=$(ffprobe -v error -show_entries format=duration \
+        -of default=noprint_wrappers=1:nokey=1 "$video_file" 2>/dev/null)
+    if [[ "$duration" =~ ^[0-9]+(\.[0-9]+)?$ ]]; then
+        echo "$duration"
+    else
+        echo "0"
+    fi
+}
+
+# Function to read the container duration from ffmpeg's input banner
+get_logged_duration() {
+    local log_file="$1"
     
-    ffprobe -v quiet -print_format json -show_streams -show_format "$video_file" 2>/dev/null | \
-        jq -r '.format.duration // .streams[0].duration // "0"'
+    sed -n 's/.*Duration: \([0-9]*\):\([0-9]*\):\([0-9.]*\).*/\1 \2 \3/p' "$log_file" 2>/dev/null | head -n 1 | \
+        awk '{ printf "%.2f\n", $1 * 3600 + $2 * 60 + $3 }'
 }
 
 # Function to extract frames
@@ -64,13 +79,15 @@ extract_frames() {
         echo "Extracting frames every ${interval}s, max ${max_frames} frames..." >&2
     fi
     
-    # Extract frames using ffmpeg
-    ffmpeg -i "$video_file" \
+    # Extract frames using ffmpeg; hardware decode when available, all cores, and no audio decode
+    ffmpeg -hwaccel auto -threads 0 -i "$video_file" \
+        -an \
         -vf "fps=1/${interval},scale=${resize}" \
         -q:v $ffmpeg_quality \
         -frames:v $max_frames \
+        -nostats \
         "$output_dir/frame_%04d.jpg" \
-        -y 2>/dev/null || {
+        -y 2>"$output_dir/ffmpeg.log" || {
         echo "Error: Failed to extract frames from $video_file" >&2
         return 1
     }
@@ -108,14 +125,6 @@ process_video() {
     temp_dir=$(mktemp -d)
     trap "rm -rf '$temp_dir'" EXIT
     
-    # Get video duration
-    local duration
-    duration=$(get_video_info "$video_file")
-    
-    if [[ "$verbose" == "true" ]]; then
-        echo "Video duration: ${duration}s" >&2
-    fi
-    
     # Extract frames
     local frame_count
     frame_count=$(extract_frames "$video_file" "$temp_dir" "$interval" "$max_frames" "$quality" "$resize" "$verbose")
@@ -125,6 +134,17 @@ process_video() {
         exit 1
     fi
     
+    # Get video duration from the ffmpeg run; only probe separately if it wasn't reported
+    local duration
+    duration=$(get_logged_duration "$temp_dir/ffmpeg.log")
+    if [[ -z "$duration" ]]; then
+        duration=$(get_video_info "$video_file")
+    fi
+    
+    if [[ "$verbose" == "true" ]]; then
+        echo "Video duration: ${duration}s" >&2
+    fi
+    
     if [[ "$verbose" == "true" ]]; then
         echo "Extracted $frame_count frames" >&2
     fi
@@ -259,11 +279,6 @@ if ! command -v ffprobe >/dev/null 2>&1; then
     exit 1
 fi
 
-if ! command -v jq >/dev/null 2>&1; then
-    echo "Error: jq not found. Please install jq." >&2
-    exit 1
-fi
-
 # Validate format
 if [[ "$OUTPUT_FORMAT" != "base64" && "$OUTPUT_FORMAT" != "paths" && "$OUTPUT_FORMAT" != "both" ]]; then
     echo "Error: Invalid format. Must be 'base64', 'paths', or 'both'" >&2
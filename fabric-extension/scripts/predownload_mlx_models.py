@@ -6,8 +6,25 @@ Ensures all models are cached locally for reliable Apple Silicon performance
 
 import sys
 import os
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Use the Rust hf_transfer downloader when installed. This must be set before
+# huggingface_hub is imported (directly or via mlx_whisper), and only when the
+# package exists, since huggingface_hub errors out if the flag is set without it.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# Number of models downloaded concurrently
+MODEL_WORKERS = 4
+
+# Number of parallel connections per model snapshot
+SHARD_WORKERS = 8
+
+# Files mlx_whisper needs to load a model; skips READMEs and other repo extras
+MODEL_FILE_PATTERNS = ["*.json", "*.safetensors", "*.npz", "tokenizer*", "*.txt"]
+
 def predownload_mlx_models():
     """Predownload all MLX Whisper models to local cache"""
     try:
@@ -24,50 +41,61 @@ def predownload_mlx_models():
         "small": "mlx-community/whisper-small",
         "medium": "mlx-community/whisper-medium",
         "large-v2": "mlx-community/whisper-large-v2",
-        "large-v3": "mlx-community/whisper-large-v3"
+        "large-v3": "mlx-community/whisper-large-v3",
+        "distil-large-v3": "mlx-community/distil-whisper-large-v3",
+        # 4-bit variants used by --whisper-mlx-4bit / --mlx-4bit
+        "tiny-4bit": "mlx-community/whisper-tiny-mlx-4bit",
+        "base-4bit": "mlx-community/whisper-base-mlx-4bit",
+        "small-4bit": "mlx-community/whisper-small-mlx-4bit",
+        "medium-4bit": "mlx-community/whisper-medium-mlx-4bit",
+        "large-v2-4bit": "mlx-community/whisper-large-v2-mlx-4bit"
     }
     
     print("📥 Predownloading MLX Whisper models...")
     print("This may take several minutes for larger models...")
     
-    # Create a single test audio file for all models
-    import tempfile
-    import subprocess
-    
-    # Create 1-second silent audio file for testing
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-        temp_audio = f.name
-        
     try:
-        # Generate silent audio with ffmpeg
-        subprocess.run([
-            "ffmpeg", "-f", "lavfi", "-i", "anullsrc=r=16000:d=1",
-            "-y", temp_audio
-        ], capture_output=True, check=True)
-    except subprocess.CalledProcessError:
-        print("❌ Failed to create test audio file. Is ffmpeg installed?")
+        from huggingface_hub import snapshot_download
+    except ImportError:
+        print("❌ huggingface_hub not available. Install with: pip install huggingface_hub")
         return False
     
+    def download_model(model_name, model_repo):
+        """Download a single model snapshot into the HuggingFace cache"""
+        print(f"  📦 Downloading {model_name} ({model_repo})...")
+        # snapshot_download fetches the weight shards over parallel connections
+        snapshot_download(
+            repo_id=model_repo,
+            allow_patterns=MODEL_FILE_PATTERNS,
+            max_workers=SHARD_WORKERS,
+        )
+        return model_name
+    
+    # Models are independent and network-bound, so fetch several at once
     success_count = 0
-    for model_name, model_repo in mlx_models.items():
-        try:
-            print(f"  📦 Downloading {model_name} ({model_repo})...")
-            
-            # This will download and cache the model
-            _ = mlx_whisper.transcribe(temp_audio, path_or_hf_repo=model_repo, verbose=False)
-            
-            print(f"  ✅ {model_name} downloaded successfully")
-            success_count += 1
-            
-        except Exception as e:
-            print(f"  ❌ Failed to download {model_name}: {e}")
-            continue
+    executor = ThreadPoolExecutor(max_workers=MODEL_WORKERS)
+    futures = {
+        executor.submit(download_model, model_name, model_repo): model_name
+        for model_name, model_repo in mlx_models.items()
+    }
     
-    # Clean up test file
     try:
-        os.unlink(temp_audio)
-    except OSError:
-        pass
+        for future in as_completed(futures):
+            model_name = futures[future]
+            try:
+                future.result()
+                print(f"  ✅ {model_name} downloaded successfully")
+                success_count += 1
+            except Exception as e:
+                print(f"  ❌ Failed to download {model_name}: {e}")
+    except KeyboardInterrupt:
+        # Cancel queued downloads and abandon in-flight ones; partial files
+        # are resumed by huggingface_hub on the next run
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("\n⏹️  Predownload interrupted")
+        os._exit(130)
+    
+    executor.shutdown()
     
     print(f"\n🎉 Predownload complete: {success_count}/{len(mlx_models)} models cached")
     print("💾 Models are now cached locally for offline use")
@@ -85,17 +113,20 @@ def check_mlx_models():
         import mlx_whisper
         print("🔍 Checking MLX model cache...")
         
-        # MLX models are typically cached in ~/.cache/huggingface/
-        cache_dir = Path.home() / ".cache" / "huggingface"
+        from huggingface_hub import constants
+        
+        # Honors HF_HOME / HF_HUB_CACHE so shared caches are detected too
+        cache_dir = Path(constants.HF_HUB_CACHE)
         if cache_dir.exists():
             print(f"📁 Cache directory: {cache_dir}")
             
             # List cached whisper models
-            whisper_dirs = list(cache_dir.glob("**/models--openai--whisper*"))
+            # Matches whisper-* and distil-whisper-* repos
+            whisper_dirs = sorted(cache_dir.glob("models--mlx-community--*whisper*"))
             if whisper_dirs:
                 print("✅ Cached MLX Whisper models found:")
                 for dir_path in whisper_dirs:
-                    model_name = dir_path.name.replace("models--openai--whisper-", "")
+                    model_name = dir_path.name.replace("models--mlx-community--", "").replace("whisper-", "", 1)
                     print(f"  • {model_name}")
             else:
                 print("📭 No cached MLX Whisper models found")
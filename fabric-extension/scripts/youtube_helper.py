@@ -5,45 +5,57 @@ Downloads videos and extracts transcripts using yt-dlp
 """
 
 import argparse
+import html
+import io
 import json
-import os
+import re
+import shutil
 import sys
 import tempfile
 import subprocess
+import urllib.error
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+# Caption languages to request, in order of preference
+SUBTITLE_LANGS = ['en', 'en-US', 'en-GB']
+
+# Inline VTT markup such as <c>, <c.colorE5E5E5>, <i> and <00:00:05.000>
+_VTT_TAG_RE = re.compile(r'<[^>]+>')
+
+# Cue timestamp as HH:MM:SS.mmm or MM:SS.mmm
+_VTT_TIMESTAMP_RE = re.compile(r'(?:(\d+):)?(\d+):(\d+)\.(\d+)')
+
+# Container formats yt-dlp may produce for a downloaded video
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.webm', '.avi', '.mov', '.flv', '.3gp'})
 
 
 def check_ytdlp():
     """Check if yt-dlp is available and provide helpful error messages"""
-    try:
-        result = subprocess.run(['yt-dlp', '--version'], 
-                              capture_output=True, text=True, check=True)
-        return True
-    except FileNotFoundError:
+    # A PATH lookup is enough here; launching yt-dlp --version costs a full
+    # interpreter startup, and any real failure surfaces on the actual call
+    if shutil.which('yt-dlp') is None:
         print("Error: yt-dlp not found. Please install it:", file=sys.stderr)
         print("  pip install yt-dlp", file=sys.stderr)
         print("  # or", file=sys.stderr) 
         print("  pipx install yt-dlp", file=sys.stderr)
         return False
-    except subprocess.CalledProcessError as e:
-        print(f"Error: yt-dlp check failed: {e}", file=sys.stderr)
-        print("Try updating yt-dlp: pip install --upgrade yt-dlp", file=sys.stderr)
-        return False
+    return True
 
 
 def extract_youtube_transcript(url: str, verbose: bool = False) -> Dict[str, Any]:
     """Extract transcript from YouTube video using yt-dlp"""
     try:
-        # Build yt-dlp command for transcript extraction
+        # Build yt-dlp command for transcript extraction. With --dump-json yt-dlp
+        # only resolves the subtitle URLs; nothing is written to disk.
         cmd = [
             'yt-dlp',
             '--write-subs',
             '--write-auto-subs',
-            '--sub-langs', 'en,en-US,en-GB',
+            '--sub-langs', ','.join(SUBTITLE_LANGS),
             '--sub-format', 'vtt',
             '--skip-download',
-            '--output', '%(title)s.%(ext)s',
+            '--dump-json',
             url
         ]
         
@@ -53,45 +65,36 @@ def extract_youtube_transcript(url: str, verbose: bool = False) -> Dict[str, Any
         else:
             cmd.append('--quiet')
         
-        # Create temporary directory for transcript files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            os.chdir(temp_dir)
-            
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                
-                # Find the downloaded VTT file
-                vtt_files = list(Path('.').glob('*.vtt'))
-                if not vtt_files:
-                    raise FileNotFoundError("No transcript file found. Video may not have captions available.")
-                
-                vtt_file = vtt_files[0]
-                
-                # Parse VTT file to extract transcript segments
-                segments = parse_vtt_file(vtt_file)
-                
-                # Get video info for metadata
-                info_cmd = ['yt-dlp', '--dump-json', '--quiet', url]
-                info_result = subprocess.run(info_cmd, capture_output=True, text=True, check=True)
-                video_info = json.loads(info_result.stdout)
-                
-                # Build transcript output
-                full_text = " ".join([seg["text"] for seg in segments])
-                
-                return {
-                    "text": full_text,
-                    "segments": segments,
-                    "language": "en",  # Default to English for YouTube transcripts
-                    "duration": video_info.get("duration", 0),
-                    "backend": "youtube-transcript",
-                    "source_file": url,
-                    "model": "youtube-captions",
-                    "timestamp": __import__("time").time()
-                }
-                
-            finally:
-                os.chdir(original_cwd)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        
+        # Video metadata printed by --dump-json (one JSON object per line)
+        video_info = json.loads(result.stdout.partition('\n')[0])
+        
+        # Pick the first requested subtitle track in language preference order
+        subtitles = video_info.get("requested_subtitles") or {}
+        subtitle = next((subtitles[lang] for lang in SUBTITLE_LANGS if lang in subtitles), None)
+        if subtitle is None:
+            raise FileNotFoundError("No English captions found. Video may not have captions available.")
+        
+        # Parse the VTT straight from memory instead of a temporary file
+        vtt_text = subtitle.get("data")
+        if vtt_text is None:
+            vtt_text = fetch_subtitles(subtitle["url"], video_info.get("http_headers", {}))
+        segments = parse_vtt_lines(io.StringIO(vtt_text))
+        
+        # Build transcript output
+        full_text = " ".join([seg["text"] for seg in segments])
+        
+        return {
+            "text": full_text,
+            "segments": segments,
+            "language": "en",  # Default to English for YouTube transcripts
+            "duration": video_info.get("duration", 0),
+            "backend": "youtube-transcript",
+            "source_file": url,
+            "model": "youtube-captions",
+            "timestamp": __import__("time").time()
+        }
                 
     except subprocess.CalledProcessError as e:
         error_msg = f"yt-dlp transcript extraction failed: {e}"
@@ -104,61 +107,87 @@ def extract_youtube_transcript(url: str, verbose: bool = False) -> Dict[str, Any
         
         raise RuntimeError(error_msg)
     except FileNotFoundError as e:
-        raise RuntimeError(f"Transcript file processing failed: {e}")
+        raise RuntimeError(f"No transcript available: {e}")
+    except urllib.error.URLError as e:
+        raise RuntimeError(f"Subtitle download failed: {e}")
     except json.JSONDecodeError as e:
         raise RuntimeError(f"Failed to parse video information: {e}")
 
 
-def parse_vtt_file(vtt_path: Path) -> List[Dict[str, Any]]:
-    """Parse VTT subtitle file and convert to transcript segments"""
+def fetch_subtitles(subtitle_url: str, headers: Dict[str, str]) -> str:
+    """Download a subtitle track into memory"""
+    # urllib.request pulls in http.client, ssl and email; only pay for it when
+    # captions are actually fetched
+    import urllib.request
+
+    request = urllib.request.Request(subtitle_url, headers=headers)
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read().decode('utf-8')
+
+
+def parse_vtt_lines(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """Parse VTT subtitle lines and convert to transcript segments"""
     segments = []
     
+    def close_cue():
+        # Join the cue's lines once instead of growing a string per line
+        if cue_lines:
+            segments.append({
+                "id": len(segments),
+                "start": cue_start,
+                "end": cue_end,
+                "text": " ".join(cue_lines)
+            })
+    
     try:
-        with open(vtt_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        current_segment = None
-        segment_id = 0
+        # Text lines of the open cue, or None between cues
+        cue_lines = None
+        cue_start = cue_end = 0.0
         
         for line in lines:
+            if cue_lines is None:
+                # Between cues only a timing line matters; the WEBVTT header,
+                # NOTE/STYLE blocks and cue identifiers are skipped unstripped
+                if '-->' not in line:
+                    continue
+                
+                # Time range line (e.g., "00:00:01.000 --> 00:00:05.000")
+                try:
+                    cue_start, cue_end = parse_vtt_timing(line.strip())
+                except ValueError:
+                    continue
+                
+                cue_lines = []
+                continue
+            
             line = line.strip()
             
-            # Skip header and empty lines
-            if not line or line.startswith('WEBVTT') or line.startswith('NOTE'):
-                continue
+            # A blank line always ends the cue (WebVTT); empty cues are dropped
+            if not line:
+                close_cue()
+                cue_lines = None
             
-            # Time range line (e.g., "00:00:01.000 --> 00:00:05.000")
-            if '-->' in line:
+            # Next timing line without a separating blank line
+            elif '-->' in line:
+                close_cue()
+                cue_lines = None
+                
                 try:
-                    start_time, end_time = line.split(' --> ')
-                    start_seconds = parse_vtt_timestamp(start_time)
-                    end_seconds = parse_vtt_timestamp(end_time)
-                    
-                    current_segment = {
-                        "id": segment_id,
-                        "start": start_seconds,
-                        "end": end_seconds,
-                        "text": ""
-                    }
-                    segment_id += 1
+                    cue_start, cue_end = parse_vtt_timing(line)
                 except ValueError:
                     continue
+                
+                cue_lines = []
             
             # Text line
-            elif current_segment is not None and line:
-                # Clean up VTT formatting
-                clean_text = line.replace('<c>', '').replace('</c>', '')
-                clean_text = clean_text.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-                
-                if current_segment["text"]:
-                    current_segment["text"] += " " + clean_text
-                else:
-                    current_segment["text"] = clean_text
-                
-                # If this is the end of the segment, add it to segments
-                if current_segment["text"]:
-                    segments.append(current_segment.copy())
-                    current_segment = None
+            else:
+                # Clean up VTT formatting (html.unescape returns early without '&')
+                if '<' in line:
+                    line = _VTT_TAG_RE.sub('', line)
+                cue_lines.append(html.unescape(line))
+    
+        # Flush the final cue if the file doesn't end with a blank line
+        close_cue()
     
     except Exception as e:
         raise RuntimeError(f"Failed to parse VTT file: {e}")
@@ -166,31 +195,49 @@ def parse_vtt_file(vtt_path: Path) -> List[Dict[str, Any]]:
     return segments
 
 
+def parse_vtt_timing(line: str) -> Tuple[float, float]:
+    """Convert a VTT cue timing line to start and end seconds"""
+    start_time, end_time = line.split(' --> ')
+    return parse_vtt_timestamp(start_time), parse_vtt_timestamp(end_time)
+
+
 def parse_vtt_timestamp(timestamp: str) -> float:
     """Convert VTT timestamp to seconds"""
-    # Handle format: "00:01:23.456" or "01:23.456"
-    parts = timestamp.split(':')
-    
-    if len(parts) == 3:  # HH:MM:SS.mmm
-        hours, minutes, seconds = parts
-        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-    elif len(parts) == 2:  # MM:SS.mmm
-        minutes, seconds = parts
-        return int(minutes) * 60 + float(seconds)
-    else:
+    # Handle format: "00:01:23.456" or "01:23.456", ignoring any trailing cue settings
+    match = _VTT_TIMESTAMP_RE.match(timestamp)
+    if match is None:
         return float(timestamp)
+    
+    hours, minutes, seconds, fraction = match.groups()
+    return (int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+            + int(fraction) / 10 ** len(fraction))
 
 
-def download_youtube_video(url: str, verbose: bool = False) -> str:
-    """Download YouTube video and return local file path"""
+def download_youtube_video(url: str, verbose: bool = False, video_only: bool = False) -> str:
+    """Download YouTube video and return local file path
+    
+    With video_only the audio track is skipped (falling back to a muxed
+    stream when no video-only format exists); use it when the transcript
+    comes from YouTube captions and the file is only needed for frames.
+    """
     try:
         # Create temporary directory for video download
         temp_dir = tempfile.mkdtemp(prefix="youtube_video_")
         
+        # Limit quality for faster processing. On YouTube best[height<=720] is in
+        # practice the 360p muxed stream; the video-only pick stays at that height
+        # and prefers H.264, since higher video-only tiers (often VP9/AV1) are
+        # larger than the whole muxed file.
+        if video_only:
+            video_format = ('bestvideo[height<=360][vcodec^=avc1]/bestvideo[height<=360]'
+                            '/best[height<=720]')
+        else:
+            video_format = 'best[height<=720]'
+        
         # Build yt-dlp command for video download
         cmd = [
             'yt-dlp',
-            '--format', 'best[height<=720]',  # Limit quality for faster processing
+            '--format', video_format,
             '--output', f'{temp_dir}/%(title)s.%(ext)s',
             url
         ]
@@ -201,11 +248,18 @@ def download_youtube_video(url: str, verbose: bool = False) -> str:
         else:
             cmd.append('--quiet')
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # Progress output is never parsed, so discard stdout; stderr streams to the
+        # terminal in verbose mode and is only kept in memory for error reporting otherwise
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=None if verbose else subprocess.PIPE,
+            text=True,
+            check=True
+        )
         
         # Find the downloaded video file
-        video_files = list(Path(temp_dir).glob('*'))
-        video_files = [f for f in video_files if f.suffix.lower() in ['.mp4', '.mkv', '.webm', '.avi']]
+        video_files = [f for f in Path(temp_dir).iterdir() if f.suffix.lower() in _VIDEO_EXTENSIONS]
         
         if not video_files:
             raise FileNotFoundError("No video file found after download")
@@ -219,21 +273,38 @@ def download_youtube_video(url: str, verbose: bool = False) -> str:
         
     except subprocess.CalledProcessError as e:
         error_msg = f"yt-dlp video download failed: {e}"
-        if "Private video" in e.stderr:
+        stderr = e.stderr or ""
+        if "Private video" in stderr:
             error_msg += "\nThis video is private or unavailable."
-        elif "Video unavailable" in e.stderr:
+        elif "Video unavailable" in stderr:
             error_msg += "\nThis video is unavailable or the URL is invalid."
-        elif "Sign in to confirm your age" in e.stderr:
+        elif "Sign in to confirm your age" in stderr:
             error_msg += "\nThis video requires age verification."
         
         raise RuntimeError(error_msg)
 
 
+def write_json(data: Dict[str, Any]) -> None:
+    """Write JSON to stdout, using orjson when it is installed
+    
+    The scribe CLI parses and re-encodes this output, so it is not indented.
+    """
+    try:
+        import orjson
+    except ImportError:
+        print(json.dumps(data, ensure_ascii=False))
+        return
+    
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+
+
 def main():
     parser = argparse.ArgumentParser(description="YouTube helper for screenscribe Fabric integration")
     parser.add_argument("url", help="YouTube URL")
     parser.add_argument("--transcript-only", action="store_true", 
                        help="Extract transcript only (don't download video)")
+    parser.add_argument("--video-only", action="store_true",
+                       help="Download the video track without audio (for frame extraction)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
@@ -246,10 +317,10 @@ def main():
         if args.transcript_only:
             # Extract transcript and output JSON
             transcript_data = extract_youtube_transcript(args.url, args.verbose)
-            print(json.dumps(transcript_data, indent=2, ensure_ascii=False))
+            write_json(transcript_data)
         else:
             # Download video and output file path
-            video_path = download_youtube_video(args.url, args.verbose)
+            video_path = download_youtube_video(args.url, args.verbose, args.video_only)
             print(video_path)
             
     except Exception as e: